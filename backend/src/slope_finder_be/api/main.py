@@ -1,20 +1,46 @@
+from contextlib import asynccontextmanager
 from datetime import datetime
 
+import aiohttp
+import numpy as np
+import orjson
 import uvicorn
 from fastapi import FastAPI
 from fastapi import HTTPException
+from fastapi import Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_jsonable_python
 
 from slope_finder_be.constants import ski_resorts
-from slope_finder_be.services.routing import calculate_air_distance
+from slope_finder_be.constants import ski_resorts_soa
+from slope_finder_be.services.routing import calculate_air_distances
 from slope_finder_be.services.weather import get_weather_data
-from slope_finder_be.pipelines.get_resort_info import enrich_resorts_with_info
+from slope_finder_be.pipelines.get_resort_info import get_enriched_page
+from slope_finder_be.pipelines.get_resort_info import prefetch_enriched_page
+from slope_finder_be.pipelines.get_resort_info import stream_enriched_resorts
 from slope_finder_be.models import Location
 from slope_finder_be.models import SkiResortsResponse
 from slope_finder_be.models import WeatherRequest
 from slope_finder_be.models import WeatherData
 
-app = FastAPI(title="Slope Finder Backend")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Share one pooled HTTP session for all outgoing API and scraping requests."""
+    app.state.http = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, limit_per_host=50, ttl_dns_cache=300)
+    )
+    yield
+    await app.state.http.close()
+
+
+app = FastAPI(
+    title="Slope Finder Backend",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 # Configure CORS
 app.add_middleware(
@@ -32,7 +58,8 @@ async def health():
 
 
 @app.get("/resorts-info")
-def get_ski_resorts_by_distance(
+async def get_ski_resorts_by_distance(
+    request: Request,
     lat: float,
     lng: float,
     date: str,
@@ -66,29 +93,10 @@ def get_ski_resorts_by_distance(
     # Parse date string to datetime object
     date_obj = datetime.fromisoformat(date)
 
-    # Step 1: Calculate air distance for all resorts and sort
-    resorts_with_metadata = []
-    for resort in ski_resorts:
-        air_distance = calculate_air_distance(
-            lat,
-            lng,
-            resort["location"]["lat"],
-            resort["location"]["lng"],
-        )
-        if air_distance < max_air_distance_km:
-            resorts_with_metadata.append(
-                {"resort": resort, "air_distance_km": air_distance}
-            )
-
-    # Sort by air distance
-    resorts_with_metadata.sort(key=lambda x: x["air_distance_km"])
-
-    # Step 2: Paginate - get the resorts for the requested page
-    start_idx = (page - 1) * page_size
-    end_idx = start_idx + page_size
-    page_resorts = resorts_with_metadata[start_idx:end_idx]
-
-    total_filtered = len(resorts_with_metadata)
+    # Step 1 & 2: Sort resorts by air distance and paginate
+    page_resorts, next_page_resorts, total_filtered = _select_page_resorts(
+        lat, lng, page, page_size, max_air_distance_km
+    )
 
     # If no resorts on this page, return empty
     if not page_resorts:
@@ -101,17 +109,117 @@ def get_ski_resorts_by_distance(
         }
 
     # Step 3: Enrich resorts with driving distances, snow reports, and weather
-    resorts_with_metadata = enrich_resorts_with_info(lat, lng, page_resorts, date_obj)
+    resorts_with_metadata = await get_enriched_page(
+        request.app.state.http, lat, lng, page_resorts, date_obj
+    )
+
+    # Step 4: Warm the cache for the next page while the client renders this one
+    if next_page_resorts:
+        prefetch_enriched_page(
+            request.app.state.http, lat, lng, next_page_resorts, date_obj
+        )
 
     return {
         "page": page,
         "page_size": page_size,
         "total_resorts": total_filtered,
-        "has_more": end_idx < total_filtered,
+        "has_more": bool(next_page_resorts),
         "resorts": resorts_with_metadata,
     }
 
 
+@app.get("/resorts-info/stream")
+async def stream_ski_resorts_by_distance(
+    request: Request,
+    lat: float,
+    lng: float,
+    date: str,
+    page: int = 1,
+    page_size: int = 10,
+    max_air_distance_km: float = 150,
+) -> StreamingResponse:
+    """
+    Streaming variant of /resorts-info returning newline-delimited JSON.
+
+    The first line holds the page metadata (page, page_size, total_resorts, has_more).
+    Every following line is one enriched resort, sent as soon as its routes, snow
+    report and weather are available, so resorts arrive in completion order rather
+    than sorted by distance.
+
+    Takes the same parameters as /resorts-info.
+    """
+    if page < 1 or page_size > 20:
+        raise HTTPException(
+            status_code=422, detail="page_size must be <= 20 and page must be >= 1"
+        )
+
+    date_obj = datetime.fromisoformat(date)
+    page_resorts, next_page_resorts, total_filtered = _select_page_resorts(
+        lat, lng, page, page_size, max_air_distance_km
+    )
+    session = request.app.state.http
+
+    async def ndjson_lines():
+        metadata = {
+            "page": page,
+            "page_size": page_size,
+            "total_resorts": total_filtered,
+            "has_more": bool(next_page_resorts),
+        }
+        yield orjson.dumps(metadata) + b"\n"
+
+        async for resort_data in stream_enriched_resorts(
+            session, lat, lng, page_resorts, date_obj
+        ):
+            yield orjson.dumps(resort_data, default=to_jsonable_python) + b"\n"
+
+        if next_page_resorts:
+            prefetch_enriched_page(session, lat, lng, next_page_resorts, date_obj)
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
+def _select_page_resorts(
+    lat: float, lng: float, page: int, page_size: int, max_air_distance_km: float
+) -> tuple[list[dict], list[dict], int]:
+    """
+    Select the resorts of the requested page and the page after it by air distance.
+
+    Returns the page items and next page items ({"resort", "air_distance_km"} dicts)
+    and the total number of resorts within max_air_distance_km.
+    """
+    # Calculate air distance for all resorts at once
+    air_distances = calculate_air_distances(
+        lat, lng, ski_resorts_soa["lats_rad"], ski_resorts_soa["lngs_rad"]
+    )
+    in_range = np.flatnonzero(air_distances < max_air_distance_km)
+    in_range_distances = air_distances[in_range]
+    total_filtered = len(in_range)
+
+    # Only the resorts up to the end of the next page (which gets prefetched)
+    # need to be ordered, so partition before sorting
+    start_idx = (page - 1) * page_size
+    end_idx = start_idx + page_size
+    k = min(end_idx + page_size, total_filtered)
+    if k < total_filtered:
+        top_k = np.argpartition(in_range_distances, k)[:k]
+    else:
+        top_k = np.arange(total_filtered)
+    sorted_indices = in_range[top_k[np.argsort(in_range_distances[top_k], kind="stable")]]
+
+    def with_air_distance(indices: np.ndarray) -> list[dict]:
+        return [
+            {"resort": ski_resorts[i], "air_distance_km": float(air_distances[i])}
+            for i in indices
+        ]
+
+    return (
+        with_air_distance(sorted_indices[start_idx:end_idx]),
+        with_air_distance(sorted_indices[end_idx:end_idx + page_size]),
+        total_filtered,
+    )
+
+
 def start_server():
     """Needed for the script entry point in pyproject.toml"""
     uvicorn.run("slope_finder_be.api.main:app", reload=True)
\ No newline at end of file
@@ -1,3 +1,5 @@
+import numpy as np
+
 ski_resorts = [
     # Major International Resorts
     {
@@ -507,4 +509,16 @@ ski_resorts = [
         "elevation": "600m - 2500m",
         "snowreport_url": "https://www.skiresort.info/ski-resort/kaltenbach-hochzillertal-hochfuegen-ski-optimal/snow-report/",
     },
-]
\ No newline at end of file
+]
+
+# Struct-of-arrays view of the resort coordinates for the distance calculation.
+# Index i in every array refers to ski_resorts[i]; the dicts are only used to
+# build responses.
+ski_resorts_soa = {
+    "lats_rad": np.radians(
+        np.array([r["location"]["lat"] for r in ski_resorts], dtype=np.float64)
+    ),
+    "lngs_rad": np.radians(
+        np.array([r["location"]["lng"] for r in ski_resorts], dtype=np.float64)
+    ),
+}
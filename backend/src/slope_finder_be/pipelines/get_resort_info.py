@@ -1,14 +1,27 @@
+import asyncio
 import time
-from concurrent.futures import ThreadPoolExecutor
+from collections.abc import AsyncIterator
 from datetime import datetime
 
+import aiohttp
+from cachetools import TTLCache
+
 from slope_finder_be.models import Location
+from slope_finder_be.models import WeatherData
 from slope_finder_be.services.routing import get_routes_batch_google
 from slope_finder_be.services.snow_report import scrape_snow_reports_batch
 from slope_finder_be.services.weather import get_weather_data_batch
+from slope_finder_be.single_flight import single_flight
+from slope_finder_be.single_flight import start_single_flight
+
+# Enriched pages are kept briefly so a prefetched next page can be served
+# directly, and in-flight enrichments are shared between concurrent requests.
+_page_cache: TTLCache = TTLCache(maxsize=256, ttl=600)
+_inflight_pages: dict[tuple, asyncio.Future] = {}
 
 
-def enrich_resorts_with_info(
+async def enrich_resorts_with_info(
+    session: aiohttp.ClientSession,
     lat: float,
     lng: float,
     page_resorts: list[dict],
@@ -18,10 +31,11 @@ def enrich_resorts_with_info(
     Enrich resort data with driving/transit routes, snow reports, and weather information.
 
     This function performs the following operations:
-    1. Fetches driving and transit routes, snow reports, and weather data in parallel
+    1. Fetches driving and transit routes, snow reports, and weather data concurrently
     2. Combines all data into enriched resort objects
 
     Args:
+        session: Shared aiohttp session used for all outgoing requests
         lat: User's latitude
         lng: User's longitude
         page_resorts: List of resorts with metadata (resort data and air_distance_km)
@@ -39,15 +53,17 @@ def enrich_resorts_with_info(
         for r in page_resorts
     ]
 
-    def fetch_driving_distances():
+    async def fetch_driving_distances():
         start = time.time()
         # Use the date to create a departure time (8:00 AM on the target date)
         departure_time = date.replace(hour=8, minute=0, second=0, microsecond=0)
-        result = get_routes_batch_google(lat, lng, destinations, departure_time)
+        result = await get_routes_batch_google(
+            session, lat, lng, destinations, departure_time
+        )
         print(f"[PROFILE] fetch_driving_distances: {time.time() - start:.2f}s")
         return result
 
-    def fetch_weather_data():
+    async def fetch_weather_data():
         start = time.time()
         locations = [
             {
@@ -57,57 +73,221 @@ def enrich_resorts_with_info(
             }
             for item in page_resorts
         ]
-        weather_results = get_weather_data_batch(locations, date)
+        # WeatherData models are passed through as-is; the response model
+        # serializes them directly, without an intermediate dict.
+        result = await get_weather_data_batch(session, locations, date)
         print(f"[PROFILE] fetch_weather_data: {time.time() - start:.2f}s")
-        return {
-            name: weather.dict() if weather else None
-            for name, weather in weather_results.items()
-        }
+        return result
 
-    def fetch_snow_reports():
+    async def fetch_snow_reports():
         start = time.time()
-        result = scrape_snow_reports_batch(
-            [r["resort"]["snowreport_url"] for r in page_resorts]
+        result = await scrape_snow_reports_batch(
+            session, [r["resort"]["snowreport_url"] for r in page_resorts]
         )
         print(f"[PROFILE] fetch_snow_reports: {time.time() - start:.2f}s")
         return result
 
-    # Execute all data fetching in parallel
+    # Execute all data fetching concurrently on the event loop
     overall_start = time.time()
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        driving_future = executor.submit(fetch_driving_distances)
-        weather_future = executor.submit(fetch_weather_data)
-        snow_reports_future = executor.submit(fetch_snow_reports)
-
-        route_infos = driving_future.result()
-        weather_data = weather_future.result()
-        snow_reports = snow_reports_future.result()
+    route_infos, weather_data, snow_reports = await asyncio.gather(
+        fetch_driving_distances(),
+        fetch_weather_data(),
+        fetch_snow_reports(),
+    )
     print(f"[PROFILE] Total parallel fetch: {time.time() - overall_start:.2f}s")
 
     # Build enriched resort data
     enriched_resorts = []
     for i, item in enumerate(page_resorts):
-        route_info = route_infos[i]
-        if route_info:
-            resort_data = {
-                **item["resort"],
-                "air_distance_km": round(item["air_distance_km"], 2),
-                "distance_km": (
-                    route_info["driving"]["distance_km"]
-                    or route_info["transit"]["distance_km"]
-                    or round(item["air_distance_km"], 2)
-                    ),
-                "duration_driving_minutes": route_info["driving"]["duration_minutes"],
-                "duration_transit_minutes": route_info["transit"]["duration_minutes"],
-                "maps_directions_url_driving": route_info["driving"]["maps_directions_url"],
-                "maps_directions_url_transit": route_info["transit"]["maps_directions_url"],
-                "snow_report": snow_reports[item["resort"]["snowreport_url"]]["data"],
-            }
-            # Add weather data if available and not None
-            weather = weather_data.get(item["resort"]["name"])
-            if weather is not None:
-                resort_data["weather"] = weather
-
+        resort_data = _build_resort_data(
+            item,
+            route_infos[i],
+            snow_reports[item["resort"]["snowreport_url"]],
+            weather_data.get(item["resort"]["name"]),
+        )
+        if resort_data is not None:
             enriched_resorts.append(resort_data)
 
     return enriched_resorts
+
+
+async def stream_enriched_resorts(
+    session: aiohttp.ClientSession,
+    lat: float,
+    lng: float,
+    page_resorts: list[dict],
+    date: datetime
+) -> AsyncIterator[dict]:
+    """
+    Yield enriched resorts one by one, as soon as each resort's data is complete.
+
+    Routes still come from one matrix request shared by the whole page, but weather
+    and snow reports are fetched per resort, so a slow snow report only delays its
+    own resort. Resorts are yielded in completion order, not in page order.
+    """
+    key = _page_key(lat, lng, page_resorts, date)
+    cached = _page_cache.get(key)
+    if cached is None and key in _inflight_pages:
+        # A prefetch or another request is already enriching this page; wait
+        # for it instead of fetching the same routes and reports again. If it
+        # fails, fall back to per-resort enrichment below, which only drops the
+        # resorts that fail.
+        try:
+            cached = await asyncio.shield(_inflight_pages[key])
+        except Exception:
+            cached = None
+    if cached is not None:
+        for resort_data in cached:
+            yield resort_data
+        return
+
+    destinations = [
+        {"lat": r["resort"]["location"]["lat"], "lng": r["resort"]["location"]["lng"]}
+        for r in page_resorts
+    ]
+    # Use the date to create a departure time (8:00 AM on the target date)
+    departure_time = date.replace(hour=8, minute=0, second=0, microsecond=0)
+    routes_task = asyncio.create_task(
+        get_routes_batch_google(session, lat, lng, destinations, departure_time)
+    )
+    queue: asyncio.Queue[dict | None] = asyncio.Queue()
+    # One semaphore for the whole page keeps the per-resort scrapes under the
+    # same concurrency cap toward skiresort.info as a batch scrape
+    snow_report_semaphore = asyncio.Semaphore(5)
+
+    async def enrich_resort(i: int, item: dict):
+        resort = item["resort"]
+        location = {
+            "name": resort["name"],
+            "lat": resort["location"]["lat"],
+            "lng": resort["location"]["lng"],
+        }
+        try:
+            weather_data, snow_reports = await asyncio.gather(
+                get_weather_data_batch(session, [location], date),
+                scrape_snow_reports_batch(
+                    session, [resort["snowreport_url"]], semaphore=snow_report_semaphore
+                ),
+            )
+            route_infos = await routes_task
+            queue.put_nowait(
+                _build_resort_data(
+                    item,
+                    route_infos[i],
+                    snow_reports[resort["snowreport_url"]],
+                    weather_data[resort["name"]],
+                )
+            )
+        except Exception as e:
+            print(f"Error enriching {resort['name']}: {e}")
+            queue.put_nowait(None)
+
+    tasks = [
+        asyncio.create_task(enrich_resort(i, item)) for i, item in enumerate(page_resorts)
+    ]
+    try:
+        for _ in tasks:
+            resort_data = await queue.get()
+            if resort_data is not None:
+                yield resort_data
+    finally:
+        # Stop outstanding fetches if the client disconnects mid-stream
+        for task in (*tasks, routes_task):
+            task.cancel()
+
+
+def _build_resort_data(
+    item: dict,
+    route_info: dict | None,
+    snow_report: dict,
+    weather: WeatherData | None,
+) -> dict | None:
+    """Combine a page item with its route, snow report and weather, or None if unreachable."""
+    if not route_info:
+        return None
+
+    resort_data = {
+        **item["resort"],
+        "air_distance_km": round(item["air_distance_km"], 2),
+        "distance_km": (
+            route_info["driving"]["distance_km"]
+            or route_info["transit"]["distance_km"]
+            or round(item["air_distance_km"], 2)
+            ),
+        "duration_driving_minutes": route_info["driving"]["duration_minutes"],
+        "duration_transit_minutes": route_info["transit"]["duration_minutes"],
+        "maps_directions_url_driving": route_info["driving"]["maps_directions_url"],
+        "maps_directions_url_transit": route_info["transit"]["maps_directions_url"],
+        "snow_report": snow_report["data"],
+    }
+    # Add weather data if available and not None
+    if weather is not None:
+        resort_data["weather"] = weather
+
+    return resort_data
+
+
+async def get_enriched_page(
+    session: aiohttp.ClientSession,
+    lat: float,
+    lng: float,
+    page_resorts: list[dict],
+    date: datetime
+) -> list[dict]:
+    """
+    Return the enriched resorts for a page, reusing cached or in-flight results.
+
+    Concurrent requests for the same page share a single enrichment
+    (single-flight), and finished pages are cached for a few minutes.
+    """
+    key = _page_key(lat, lng, page_resorts, date)
+    cached = _page_cache.get(key)
+    if cached is not None:
+        return cached
+
+    return await single_flight(
+        _inflight_pages,
+        key,
+        lambda: _enrich_and_cache(key, session, lat, lng, page_resorts, date),
+    )
+
+
+def prefetch_enriched_page(
+    session: aiohttp.ClientSession,
+    lat: float,
+    lng: float,
+    page_resorts: list[dict],
+    date: datetime
+) -> None:
+    """Start enriching a page in the background so a later request hits the cache."""
+    key = _page_key(lat, lng, page_resorts, date)
+    if key not in _page_cache:
+        start_single_flight(
+            _inflight_pages,
+            key,
+            lambda: _enrich_and_cache(key, session, lat, lng, page_resorts, date),
+        )
+
+
+def _page_key(lat: float, lng: float, page_resorts: list[dict], date: datetime) -> tuple:
+    return (lat, lng, date.date(), tuple(r["resort"]["id"] for r in page_resorts))
+
+
+async def _enrich_and_cache(
+    key: tuple,
+    session: aiohttp.ClientSession,
+    lat: float,
+    lng: float,
+    page_resorts: list[dict],
+    date: datetime
+) -> list[dict]:
+    """Enrich a page and store the result in the page cache."""
+    try:
+        enriched_resorts = await enrich_resorts_with_info(
+            session, lat, lng, page_resorts, date
+        )
+    except Exception as e:
+        print(f"Error enriching resorts page: {e}")
+        raise
+    _page_cache[key] = enriched_resorts
+    return enriched_resorts
@@ -1,6 +1,6 @@
+import asyncio
 import os
 
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from math import radians
 from math import sin
@@ -8,7 +8,8 @@ from math import cos
 from math import sqrt
 from math import atan2
 
-import requests
+import aiohttp
+import numpy as np
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -38,7 +39,30 @@ def calculate_air_distance(lat1: float, lng1: float, lat2: float, lng2: float) -
     return R * c
 
 
-def get_driving_distances_batch(
+def calculate_air_distances(
+    lat: float, lng: float, lats_rad: np.ndarray, lngs_rad: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized Haversine distance from one coordinate to many.
+    lats_rad and lngs_rad are the destination coordinates in radians.
+    Returns an array of distances in kilometers.
+    """
+    R = 6371  # Earth's radius in kilometers
+
+    lat_rad = np.radians(lat)
+    delta_lat = lats_rad - lat_rad
+    delta_lng = lngs_rad - np.radians(lng)
+
+    a = (
+        np.sin(delta_lat / 2) ** 2
+        + np.cos(lat_rad) * np.cos(lats_rad) * np.sin(delta_lng / 2) ** 2
+    )
+
+    return 2 * R * np.arcsin(np.sqrt(a))
+
+
+async def get_driving_distances_batch(
+    session: aiohttp.ClientSession,
     origin_lat: float, origin_lng: float, destinations: list[dict]
 ) -> list[dict]:
     """
@@ -68,9 +92,9 @@ def get_driving_distances_batch(
         "annotations": "distance,duration",
     }
 
-    response = requests.get(url, params=params)
-    response.raise_for_status()
-    data = response.json()
+    async with session.get(url, params=params) as response:
+        response.raise_for_status()
+        data = await response.json()
     print(data)
 
     if not data.get("durations") or not data.get("distances"):
@@ -95,7 +119,8 @@ def get_driving_distances_batch(
     return results
 
 
-def get_routes_batch_google(
+async def get_routes_batch_google(
+    session: aiohttp.ClientSession,
     origin_lat: float,
     origin_lng: float,
     destinations: list[dict],
@@ -106,6 +131,7 @@ def get_routes_batch_google(
     Makes 2 API calls total (one for DRIVE mode, one for TRANSIT mode) for all destinations.
 
     Args:
+        session: Shared aiohttp session used for both requests
         origin_lat: Origin latitude
         origin_lng: Origin longitude
         destinations: List of dicts with 'lat' and 'lng' keys
@@ -165,7 +191,7 @@ def get_routes_batch_google(
         for _ in destinations
     ]
 
-    def fetch_routes(travel_mode: str):
+    async def fetch_routes(travel_mode: str):
         """
         Fetch routes from Google API for a specific travel mode.
 
@@ -187,20 +213,17 @@ def get_routes_batch_google(
             body["departureTime"] = departure_time_str
 
         try:
-            response = requests.post(url, json=body, headers=headers)
-            response.raise_for_status()
-            return response.json()
+            async with session.post(url, json=body, headers=headers) as response:
+                response.raise_for_status()
+                return await response.json()
         except Exception as e:
             print(f"Error fetching {travel_mode.lower()} routes: {e}")
             return []
 
-    # Execute both API calls in parallel
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        driving_future = executor.submit(fetch_routes, "DRIVE")
-        transit_future = executor.submit(fetch_routes, "TRANSIT")
-
-        driving_data_list = driving_future.result()
-        transit_data_list = transit_future.result()
+    # Execute both API calls concurrently
+    driving_data_list, transit_data_list = await asyncio.gather(
+        fetch_routes("DRIVE"), fetch_routes("TRANSIT")
+    )
 
     # Process driving routes
     for data in driving_data_list:
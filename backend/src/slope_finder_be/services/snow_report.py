@@ -1,21 +1,38 @@
-from concurrent.futures import ThreadPoolExecutor
-from concurrent.futures import as_completed
+import asyncio
 
-import requests
+import aiohttp
 from bs4 import BeautifulSoup
 
+from slope_finder_be.single_flight import single_flight
 
-def scrape_snow_report(url: str) -> dict:
+# Concurrent scrapes of the same page share one in-flight request
+_inflight_reports: dict[str, asyncio.Future] = {}
+
+
+async def scrape_snow_report(session: aiohttp.ClientSession, url: str) -> dict:
     """Scrape ski resort snow report from skiresort.info"""
-    response = requests.get(
+    return await single_flight(
+        _inflight_reports, url, lambda: _fetch_snow_report(session, url)
+    )
+
+
+async def _fetch_snow_report(session: aiohttp.ClientSession, url: str) -> dict:
+    async with session.get(
         url,
         headers={
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         },
-    )
-    response.raise_for_status()
+    ) as response:
+        response.raise_for_status()
+        html = await response.text()
+
+    # BeautifulSoup parsing is CPU-bound, keep it off the event loop
+    return await asyncio.to_thread(_parse_snow_report, html)
+
 
-    soup = BeautifulSoup(response.text, "html.parser")
+def _parse_snow_report(html: str) -> dict:
+    """Extract pistes, lifts, snow depth and update date from a snow report page."""
+    soup = BeautifulSoup(html, "html.parser")
 
     data = {"pistes_km": None, "lifts": None, "snow_depth_cm": None, "updated_on": None}
 
@@ -44,48 +61,66 @@ def scrape_snow_report(url: str) -> dict:
     return data
 
 
-def scrape_snow_reports_batch(urls: list[str], max_workers: int = 5) -> dict[str, dict]:
+async def scrape_snow_reports_batch(
+    session: aiohttp.ClientSession,
+    urls: list[str],
+    max_concurrency: int = 5,
+    semaphore: asyncio.Semaphore | None = None,
+) -> dict[str, dict]:
     """
-    Scrape multiple ski resort snow reports in parallel.
+    Scrape multiple ski resort snow reports concurrently.
 
     Args:
+        session: Shared aiohttp session used for all requests
         urls: List of URLs to scrape
-        max_workers: Maximum number of parallel requests (default: 5)
+        max_concurrency: Maximum number of requests in flight at once (default: 5)
+        semaphore: Optional semaphore shared between several batch calls, so the
+            cap applies across all of them; overrides max_concurrency
 
     Returns:
         Dictionary mapping each URL to its scraped data or error information
     """
-    results = {}
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def scrape_limited(url: str) -> dict:
+        async with semaphore:
+            return await scrape_snow_report(session, url)
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_url = {executor.submit(scrape_snow_report, url): url for url in urls}
+    reports = await asyncio.gather(
+        *(scrape_limited(url) for url in urls), return_exceptions=True
+    )
 
-        for future in as_completed(future_to_url):
-            url = future_to_url[future]
-            try:
-                data = future.result()
-                results[url] = {"success": True, "data": data}
-            except Exception as e:
-                results[url] = {"success": False, "error": str(e)}
+    results = {}
+    for url, report in zip(urls, reports):
+        if isinstance(report, BaseException):
+            results[url] = {"success": False, "error": str(report)}
+        else:
+            results[url] = {"success": True, "data": report}
 
     return results
 
 
+async def _main():
+    async with aiohttp.ClientSession() as session:
+        # Single URL example
+        url = "https://www.skiresort.info/ski-resort/adelboden-lenk/snow-report/"
+        report = await scrape_snow_report(session, url)
+        print("Single report:")
+        print(report)
+
+        # Batch example
+        urls = [
+            "https://www.skiresort.info/ski-resort/adelboden-lenk/snow-report/",
+            "https://www.skiresort.info/ski-resort/zermatt-matterhorn/snow-report/",
+            "https://www.skiresort.info/ski-resort/verbier-4-vallees/snow-report/",
+        ]
+        print("\nBatch reports:")
+        batch_results = await scrape_snow_reports_batch(session, urls, max_concurrency=3)
+        for url, result in batch_results.items():
+            print(f"\n{url}:")
+            print(result)
+
+
 if __name__ == "__main__":
-    # Single URL example
-    url = "https://www.skiresort.info/ski-resort/adelboden-lenk/snow-report/"
-    report = scrape_snow_report(url)
-    print("Single report:")
-    print(report)
-
-    # Batch example
-    urls = [
-        "https://www.skiresort.info/ski-resort/adelboden-lenk/snow-report/",
-        "https://www.skiresort.info/ski-resort/zermatt-matterhorn/snow-report/",
-        "https://www.skiresort.info/ski-resort/verbier-4-vallees/snow-report/",
-    ]
-    print("\nBatch reports:")
-    batch_results = scrape_snow_reports_batch(urls, max_workers=3)
-    for url, result in batch_results.items():
-        print(f"\n{url}:")
-        print(result)
+    asyncio.run(_main())
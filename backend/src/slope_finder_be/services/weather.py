@@ -1,26 +1,124 @@
+import asyncio
 import os
-import requests
-from concurrent.futures import ThreadPoolExecutor
+import random
+from collections.abc import Coroutine
 from datetime import datetime, timedelta
+from typing import Any
 
+import aiohttp
+import orjson
+from cachetools import TTLCache
 from dotenv import load_dotenv
 from slope_finder_be.models import WeatherData, WeatherPeriod
+from slope_finder_be.single_flight import single_flight
 
 load_dotenv()
 
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 GOOGLE_WEATHER_BASE_URL = "https://weather.googleapis.com/v1"
 
-
-def get_weather_data(lat: float, lng: float, date: datetime) -> WeatherData:
+# Google Weather data only changes hourly, so raw API responses and the
+# aggregated WeatherData per resort are cached in-process for 30 minutes.
+_hours_cache: TTLCache = TTLCache(maxsize=4096, ttl=1800)
+_weather_cache: TTLCache = TTLCache(maxsize=1024, ttl=1800)
+# Identical requests that are already in flight are shared instead of repeated
+_inflight_hours: dict[tuple, asyncio.Future] = {}
+
+# Transient failures (timeouts, connection errors, 429 and 5xx) are retried
+# with jittered exponential backoff. Connecting and each socket read are
+# capped so a single straggler cannot dominate the latency of a whole batch;
+# waiting for a free connection in the shared pool is not capped, so a busy
+# local pool never counts as a Google failure.
+REQUEST_TIMEOUT_S = 5
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(
+    total=None, sock_connect=REQUEST_TIMEOUT_S, sock_read=REQUEST_TIMEOUT_S
+)
+MAX_ATTEMPTS = 3
+RETRY_BACKOFF_S = 0.1
+RETRY_BACKOFF_MAX_S = 1.0
+
+
+async def get_weather_data(
+    session: aiohttp.ClientSession, lat: float, lng: float, date: datetime
+) -> WeatherData:
     """Get weather data for a specific location and date from Google Weather API."""
-    if not GOOGLE_API_KEY:
-        raise ValueError("GOOGLE_API_KEY not set in environment variables")
+    now = datetime.now()
+    history_hours, forecast_hours = _compute_time_windows(date, now)
+    history, forecast = await asyncio.gather(
+        *_weather_fetches(
+            session, lat, lng, history_hours, forecast_hours, _hour_bucket(now)
+        )
+    )
+    return _aggregate_weather(history + forecast, *_date_keys(date))
 
-    target_date = date.date()
-    previous_date = target_date - timedelta(days=1)
 
+async def get_weather_data_batch(
+    session: aiohttp.ClientSession, locations: list[dict], date: datetime
+) -> dict[str, WeatherData | None]:
+    """
+    Get weather data for multiple locations concurrently.
+
+    The history and forecast requests of every location are issued as one
+    wave, then the responses are aggregated per location.
+
+    Args:
+        session: Shared aiohttp session used for all requests
+        locations: List of dicts with 'name', 'lat', 'lng' keys
+        date: Target datetime for weather data
+
+    Returns:
+        Dict mapping location name to WeatherData (or None if fetch failed)
+    """
+    target_date = date.date()
+    weather_by_name = {}
+    missing = []
+    for location in locations:
+        cached = _weather_cache.get((location["name"], target_date))
+        if cached is not None:
+            weather_by_name[location["name"]] = cached
+        else:
+            missing.append(location)
+
+    # The time windows, cache hour bucket and date keys only depend on the date
+    # and the current time, so compute them once for all locations
     now = datetime.now()
+    history_hours, forecast_hours = _compute_time_windows(date, now)
+    hour_bucket = _hour_bucket(now)
+    target_key, previous_key = _date_keys(date)
+
+    # Two requests per location: results[2 * i] is history, results[2 * i + 1] forecast
+    fetches = []
+    for location in missing:
+        fetches.extend(
+            _weather_fetches(
+                session,
+                location["lat"],
+                location["lng"],
+                history_hours,
+                forecast_hours,
+                hour_bucket,
+            )
+        )
+    results = await asyncio.gather(*fetches, return_exceptions=True)
+
+    for i, location in enumerate(missing):
+        history, forecast = results[2 * i], results[2 * i + 1]
+        weather = None
+        if not isinstance(history, BaseException) and not isinstance(forecast, BaseException):
+            try:
+                weather = _aggregate_weather(history + forecast, target_key, previous_key)
+                _weather_cache[(location["name"], target_date)] = weather
+            except Exception:
+                pass
+        weather_by_name[location["name"]] = weather
+
+    return weather_by_name
+
+
+def _compute_time_windows(date: datetime, now: datetime) -> tuple[int, int]:
+    """Return how many hours of history and forecast cover the day before and the target date."""
+    target_date = date.date()
+    previous_date = target_date - timedelta(days=1)
 
     # IMPORTANT: The Google Weather API does not support querying by date range.
     # The hourly endpoints only accept a `hours` parameter that fetches N hours
@@ -48,16 +146,46 @@ def get_weather_data(lat: float, lng: float, date: datetime) -> WeatherData:
         # Some of the needed data is in the future
         forecast_hours = min(int((end_needed - now).total_seconds() / 3600) + 1, 168)
 
-    # weather data
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        forecast_future = executor.submit(_fetch_google_weather, "forecast", lat, lng, forecast_hours) if forecast_hours > 0 else None
-        history_future = executor.submit(_fetch_google_weather, "history", lat, lng, history_hours) if history_hours > 0 else None
-        
-        forecast = forecast_future.result() if forecast_future else []
-        history = history_future.result() if history_future else []
+    return history_hours, forecast_hours
+
+
+def _hour_bucket(now: datetime) -> str:
+    """Clock hour used in the response cache key; responses only change hourly."""
+    return now.strftime("%Y%m%d%H")
+
+
+def _date_keys(date: datetime) -> tuple[int, int]:
+    """Packed YYYYMMDD keys of the target date and the day before it."""
+    target_date = date.date()
+    previous_date = target_date - timedelta(days=1)
+    return (
+        _date_key(target_date.year, target_date.month, target_date.day),
+        _date_key(previous_date.year, previous_date.month, previous_date.day),
+    )
+
 
-    # Combine all hours for easier filtering
-    all_hours = history + forecast
+def _weather_fetches(
+    session: aiohttp.ClientSession,
+    lat: float,
+    lng: float,
+    history_hours: int,
+    forecast_hours: int,
+    hour_bucket: str,
+) -> tuple[Coroutine[Any, Any, list[dict]], Coroutine[Any, Any, list[dict]]]:
+    """Build the history and forecast fetches for one location."""
+    return (
+        _fetch_google_weather(session, "history", lat, lng, history_hours, hour_bucket),
+        _fetch_google_weather(session, "forecast", lat, lng, forecast_hours, hour_bucket),
+    )
+
+
+def _aggregate_weather(
+    all_hours: list[dict], target_key: int, previous_key: int
+) -> WeatherData:
+    """
+    Aggregate combined history and forecast hours into WeatherData for the target date.
+    target_key and previous_key are the packed dates from _date_keys.
+    """
 
     # Group hours by time period for target date (using local time)
     morning, midday, afternoon = [], [], []
@@ -65,11 +193,11 @@ def get_weather_data(lat: float, lng: float, date: datetime) -> WeatherData:
 
     for h in all_hours:
         display = h.get("displayDateTime", {})
-        h_date = (display.get("year"), display.get("month"), display.get("day"))
-        hour = display.get("hours", 0)
+        h_date = _date_key(display.get("year", 0), display.get("month", 0), display.get("day", 0))
 
         # Collect hours for target date weather periods
-        if h_date == (target_date.year, target_date.month, target_date.day):
+        if h_date == target_key:
+            hour = display.get("hours", 0)
             if 8 <= hour <= 10:
                 morning.append(h)
             elif 11 <= hour <= 13:
@@ -78,7 +206,7 @@ def get_weather_data(lat: float, lng: float, date: datetime) -> WeatherData:
                 afternoon.append(h)
 
         # Sum snowfall from previous day (24h before target date)
-        if h_date == (previous_date.year, previous_date.month, previous_date.day):
+        elif h_date == previous_key:
             snowfall_prev_day += _get_snowfall_cm(h)
 
     return WeatherData(
@@ -89,52 +217,86 @@ def get_weather_data(lat: float, lng: float, date: datetime) -> WeatherData:
     )
 
 
-def get_weather_data_batch(
-    locations: list[dict], date: datetime
-) -> dict[str, WeatherData | None]:
-    """
-    Get weather data for multiple locations in parallel.
-
-    Args:
-        locations: List of dicts with 'name', 'lat', 'lng' keys
-        date: Target datetime for weather data
+async def _fetch_google_weather(
+    session: aiohttp.ClientSession,
+    endpoint: str,
+    lat: float,
+    lng: float,
+    hours: int,
+    hour_bucket: str,
+) -> list[dict]:
+    """Fetch data from Google Weather API with pagination. Endpoint is 'forecast' or 'history'."""
+    if not GOOGLE_API_KEY:
+        raise ValueError("GOOGLE_API_KEY not set in environment variables")
 
-    Returns:
-        Dict mapping location name to WeatherData (or None if fetch failed)
-    """
-    def fetch_single(location: dict) -> tuple[str, WeatherData | None]:
-        name = location["name"]
-        try:
-            weather = get_weather_data(location["lat"], location["lng"], date)
-            return (name, weather)
-        except Exception:
-            return (name, None)
+    if hours <= 0:
+        return []
 
-    with ThreadPoolExecutor(max_workers=20) as executor:
-        results = list(executor.map(fetch_single, locations))
+    # Responses for the same location, window size and clock hour are identical
+    cache_key = (endpoint, round(lat, 3), round(lng, 3), hours, hour_bucket)
+    cached = _hours_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
-    return dict(results)
+    return await single_flight(
+        _inflight_hours,
+        cache_key,
+        lambda: _fetch_google_weather_pages(session, endpoint, lat, lng, hours, cache_key),
+    )
 
 
-def _fetch_google_weather(endpoint: str, lat: float, lng: float, hours: int) -> list[dict]:
-    """Fetch data from Google Weather API with pagination. Endpoint is 'forecast' or 'history'."""
+async def _fetch_google_weather_pages(
+    session: aiohttp.ClientSession,
+    endpoint: str,
+    lat: float,
+    lng: float,
+    hours: int,
+    cache_key: tuple,
+) -> list[dict]:
+    """Fetch all result pages for one Google Weather request and cache the hours."""
     url = f"{GOOGLE_WEATHER_BASE_URL}/{endpoint}/hours:lookup"
     hours_key = f"{endpoint}Hours"  # forecastHours or historyHours
     params = {"key": GOOGLE_API_KEY, "location.latitude": lat, "location.longitude": lng, "hours": hours}
     all_hours = []
 
     while len(all_hours) < hours:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
+        data = await _get_json_with_retry(session, url, params)
         all_hours.extend(data.get(hours_key, []))
         if "nextPageToken" not in data:
             break
         params["pageToken"] = data["nextPageToken"]
 
+    _hours_cache[cache_key] = all_hours
     return all_hours
 
 
+async def _get_json_with_retry(
+    session: aiohttp.ClientSession, url: str, params: dict
+) -> dict:
+    """GET a JSON response, retrying transient errors with exponential backoff and jitter."""
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            async with session.get(
+                url, params=params, timeout=_REQUEST_TIMEOUT
+            ) as response:
+                response.raise_for_status()
+                return orjson.loads(await response.read())
+        except aiohttp.ClientError as e:
+            # Socket connect/read timeouts raise ServerTimeoutError, a ClientError
+            retryable = not isinstance(e, aiohttp.ClientResponseError) or (
+                e.status == 429 or e.status >= 500
+            )
+            if not retryable or attempt == MAX_ATTEMPTS:
+                raise
+            backoff = min(RETRY_BACKOFF_S * 2 ** (attempt - 1), RETRY_BACKOFF_MAX_S)
+            await asyncio.sleep(backoff + random.uniform(0, backoff))
+
+
+def _date_key(year: int, month: int, day: int) -> int:
+    """Pack a date into a single comparable integer (YYYYMMDD)."""
+    return year * 10000 + month * 100 + day
+
+
 def _get_snowfall_cm(h: dict) -> float:
     """Extract snowfall in cm from hour data using snowQpf field."""
     precip = h.get("precipitation", {})
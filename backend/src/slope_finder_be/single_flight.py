@@ -0,0 +1,50 @@
+import asyncio
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Hashable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+def start_single_flight(
+    inflight: dict[Hashable, asyncio.Future],
+    key: Hashable,
+    fetch: Callable[[], Awaitable[T]],
+) -> asyncio.Future:
+    """
+    Return the in-flight future for key, starting fetch() if there is none.
+
+    The entry is removed from `inflight` as soon as the fetch finishes, so later
+    callers start a fresh one (or hit a cache). While it runs, `inflight` also
+    holds the reference that keeps a fetch nobody awaits (e.g. a prefetch) alive.
+    """
+    future = inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(fetch())
+        inflight[key] = future
+        future.add_done_callback(lambda f: _finish(inflight, key, f))
+    return future
+
+
+async def single_flight(
+    inflight: dict[Hashable, asyncio.Future],
+    key: Hashable,
+    fetch: Callable[[], Awaitable[T]],
+) -> T:
+    """
+    Run fetch() at most once per key at a time and share its result.
+
+    Concurrent callers with the same key await the same in-flight future instead
+    of issuing duplicate requests.
+    """
+    # Shield the shared future so one cancelled caller does not cancel it for the others
+    return await asyncio.shield(start_single_flight(inflight, key, fetch))
+
+
+def _finish(inflight: dict[Hashable, asyncio.Future], key: Hashable, future: asyncio.Future):
+    inflight.pop(key, None)
+    # Mark the exception as retrieved: if every waiter was cancelled (or nobody
+    # awaited a prefetch), asyncio would otherwise log it as never retrieved
+    if not future.cancelled():
+        future.exception()